@@ -14,7 +14,7 @@ from jobspy.model import (
     Location,
     Country,
 )
-from jobspy.util import create_logger, create_session
+from jobspy.util import create_logger, get_shared_session
 
 log = create_logger("Bayt")
 
@@ -34,7 +34,9 @@ class BaytScraper(Scraper):
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
-        self.session = create_session(
+        # Shared per-process session: scrape_jobs rebuilds the scraper each
+        # call, so the connection pool must live at module level to be reused
+        self.session = get_shared_session(
             proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
         )
         job_list: list[JobPost] = []
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import re
 import json
+
+import orjson
 import requests
 from typing import Tuple
 from datetime import datetime, timedelta
@@ -16,7 +18,7 @@ from jobspy.glassdoor.util import (
 from jobspy.util import (
     extract_emails_from_text,
     create_logger,
-    create_session,
+    get_shared_session,
     markdown_converter,
 )
 from jobspy.exception import GlassdoorException
@@ -60,7 +62,9 @@ class Glassdoor(Scraper):
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
         self.base_url = self.scraper_input.country.get_glassdoor_url()
 
-        self.session = create_session(
+        # Shared per-process session: scrape_jobs rebuilds the scraper each
+        # call, so the connection pool must live at module level to be reused
+        self.session = get_shared_session(
             proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
         )
         token = self._get_csrf_token()
@@ -117,7 +121,7 @@ class Glassdoor(Scraper):
             if response.status_code != 200:
                 exc_msg = f"bad response status code: {response.status_code}"
                 raise GlassdoorException(exc_msg)
-            res_json = response.json()[0]
+            res_json = orjson.loads(response.text)[0]
             if "errors" in res_json:
                 raise ValueError("Error encountered in API response")
         except (
@@ -247,7 +251,7 @@ class Glassdoor(Scraper):
         res = requests.post(url, json=body, headers=headers)
         if res.status_code != 200:
             return None
-        data = res.json()[0]
+        data = orjson.loads(res.content)[0]
         desc = data["data"]["jobview"]["job"]["description"]
         if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
             desc = markdown_converter(desc)
@@ -268,7 +272,7 @@ class Glassdoor(Scraper):
                 err += f" - {res.text}"
                 log.error(f"Glassdoor response status code {res.status_code}")
                 return None, None
-        items = res.json()
+        items = orjson.loads(res.text)
 
         if not items:
             raise ValueError(f"Location '{location}' not found on Glassdoor")
@@ -16,7 +16,7 @@ from jobspy.model import (
     Location,
     JobType,
 )
-from jobspy.util import extract_emails_from_text, extract_job_type, create_session
+from jobspy.util import extract_emails_from_text, extract_job_type, get_shared_session
 from jobspy.google.util import log, find_job_info_initial_page, find_job_info
 
 
@@ -47,7 +47,9 @@ class Google(Scraper):
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
 
-        self.session = create_session(
+        # Shared per-process session: scrape_jobs rebuilds the scraper each
+        # call, so the connection pool must live at module level to be reused
+        self.session = get_shared_session(
             proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
         )
         forward_cursor, job_list = self._get_initial_cursor_and_jobs()
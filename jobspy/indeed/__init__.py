@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import math
 from datetime import datetime
+
+import orjson
 from typing import Tuple
 
 from jobspy.indeed.constant import job_search_query, api_headers
@@ -19,7 +21,7 @@ from jobspy.model import (
 from jobspy.util import (
     extract_emails_from_text,
     markdown_converter,
-    create_session,
+    get_shared_session,
     create_logger,
 )
 
@@ -35,7 +37,7 @@ class Indeed(Scraper):
         """
         super().__init__(Site.INDEED, proxies=proxies)
 
-        self.session = create_session(
+        self.session = get_shared_session(
             proxies=self.proxies, ca_cert=ca_cert, is_tls=False
         )
         self.scraper_input = None
@@ -122,7 +124,7 @@ class Indeed(Scraper):
                 f"responded with status code: {response.status_code} (submit GitHub issue if this appears to be a bug)"
             )
             return jobs, new_cursor
-        data = response.json()
+        data = orjson.loads(response.content)
         jobs = data["data"]["jobSearch"]["results"]
         new_cursor = data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
 
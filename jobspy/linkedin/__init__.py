@@ -3,6 +3,7 @@ from __future__ import annotations
 import math
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 from urllib.parse import urlparse, urlunparse, unquote
@@ -35,7 +36,7 @@ from jobspy.util import (
     extract_emails_from_text,
     currency_parser,
     markdown_converter,
-    create_session,
+    get_shared_session,
     remove_attributes,
     create_logger,
 )
@@ -48,6 +49,7 @@ class LinkedIn(Scraper):
     delay = 3
     band_delay = 4
     jobs_per_page = 25
+    detail_workers = 5
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None
@@ -56,7 +58,7 @@ class LinkedIn(Scraper):
         Initializes LinkedInScraper with the LinkedIn job search url
         """
         super().__init__(Site.LINKEDIN, proxies=proxies, ca_cert=ca_cert)
-        self.session = create_session(
+        self.session = get_shared_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
             is_tls=False,
@@ -142,6 +144,7 @@ class LinkedIn(Scraper):
             if len(job_cards) == 0:
                 return JobResponse(jobs=job_list)
 
+            page_cards = []
             for job_card in job_cards:
                 href_tag = job_card.find("a", class_="base-card__full-link")
                 if href_tag and "href" in href_tag.attrs:
@@ -151,16 +154,33 @@ class LinkedIn(Scraper):
                     if job_id in seen_ids:
                         continue
                     seen_ids.add(job_id)
+                    page_cards.append((job_card, job_id))
 
-                    try:
-                        fetch_desc = scraper_input.linkedin_fetch_description
-                        job_post = self._process_job(job_card, job_id, fetch_desc)
-                        if job_post:
-                            job_list.append(job_post)
-                        if not continue_search():
-                            break
-                    except Exception as e:
-                        raise LinkedInException(str(e))
+            fetch_desc = scraper_input.linkedin_fetch_description
+            try:
+                if fetch_desc and len(page_cards) > 1:
+                    # each description is an extra request per job; fetch the
+                    # page's batch concurrently instead of one at a time
+                    with ThreadPoolExecutor(max_workers=self.detail_workers) as executor:
+                        job_posts = list(
+                            executor.map(
+                                lambda card: self._process_job(card[0], card[1], True),
+                                page_cards,
+                            )
+                        )
+                else:
+                    job_posts = [
+                        self._process_job(job_card, job_id, fetch_desc)
+                        for job_card, job_id in page_cards
+                    ]
+            except Exception as e:
+                raise LinkedInException(str(e))
+
+            for job_post in job_posts:
+                if job_post:
+                    job_list.append(job_post)
+                if not continue_search():
+                    break
 
             if continue_search():
                 time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
@@ -6,6 +6,7 @@ import time
 from datetime import datetime, date, timedelta
 from typing import Optional
 
+import orjson
 import regex as re
 import requests
 
@@ -31,7 +32,7 @@ from jobspy.util import (
     extract_emails_from_text,
     currency_parser,
     markdown_converter,
-    create_session,
+    get_shared_session,
     create_logger,
 )
 
@@ -50,7 +51,7 @@ class Naukri(Scraper):
         Initializes NaukriScraper with the Naukri API URL
         """
         super().__init__(Site.NAUKRI, proxies=proxies, ca_cert=ca_cert)
-        self.session = create_session(
+        self.session = get_shared_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
             is_tls=False,
@@ -112,7 +113,7 @@ class Naukri(Scraper):
                     err = f"Naukri API response status code {response.status_code} - {response.text}"
                     log.error(err)
                     return JobResponse(jobs=job_list)
-                data = response.json()
+                data = orjson.loads(response.content)
                 job_details = data.get("jobDetails", [])
                 log.info(f"Received {len(job_details)} job entries from API")
                 if not job_details:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 from itertools import cycle
 
 import numpy as np
@@ -61,6 +62,7 @@ class RequestsRotating(RotatingProxySession, requests.Session):
         self.setup_session(has_retry, delay)
 
     def setup_session(self, has_retry, delay):
+        retries = 0
         if has_retry:
             retries = Retry(
                 total=3,
@@ -69,9 +71,16 @@ class RequestsRotating(RotatingProxySession, requests.Session):
                 status_forcelist=[500, 502, 503, 504, 429],
                 backoff_factor=delay,
             )
-            adapter = HTTPAdapter(max_retries=retries)
-            self.mount("http://", adapter)
-            self.mount("https://", adapter)
+        # Always mount an adapter with an explicit connection pool so
+        # keep-alive connections are reused across paginated requests and
+        # retries instead of paying a TCP+TLS handshake per call.
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=retries,
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
 
     def request(self, method, url, **kwargs):
         if self.clear_cookies:
@@ -132,6 +141,42 @@ def create_session(
     return session
 
 
+# scrape_jobs builds a fresh scraper instance per call, so sessions created
+# inside scrapers never outlive one scrape. Caching them here per settings
+# tuple keeps the connection pool (and any TLS handshakes) warm across calls.
+_session_cache: dict = {}
+_session_cache_lock = threading.Lock()
+
+
+def get_shared_session(
+    *,
+    proxies: dict | str | None = None,
+    ca_cert: str | None = None,
+    is_tls: bool = True,
+    has_retry: bool = False,
+    delay: int = 1,
+    clear_cookies: bool = False,
+) -> requests.Session:
+    """
+    Returns a process-wide session for the given settings, creating it on
+    first use. Same arguments as create_session.
+    :return: A session object
+    """
+    key = (repr(proxies), ca_cert, is_tls, has_retry, delay, clear_cookies)
+    with _session_cache_lock:
+        session = _session_cache.get(key)
+        if session is None:
+            session = _session_cache[key] = create_session(
+                proxies=proxies,
+                ca_cert=ca_cert,
+                is_tls=is_tls,
+                has_retry=has_retry,
+                delay=delay,
+                clear_cookies=clear_cookies,
+            )
+    return session
+
+
 def set_logger_level(verbose: int):
     """
     Adjusts the logger's level. This function allows the logging level to be changed at runtime.
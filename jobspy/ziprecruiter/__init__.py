@@ -7,12 +7,13 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import orjson
 from bs4 import BeautifulSoup
 
 from jobspy.ziprecruiter.constant import headers, get_cookie_data
 from jobspy.util import (
     extract_emails_from_text,
-    create_session,
+    get_shared_session,
     markdown_converter,
     remove_attributes,
     create_logger,
@@ -46,7 +47,7 @@ class ZipRecruiter(Scraper):
         super().__init__(Site.ZIP_RECRUITER, proxies=proxies)
 
         self.scraper_input = None
-        self.session = create_session(proxies=proxies, ca_cert=ca_cert)
+        self.session = get_shared_session(proxies=proxies, ca_cert=ca_cert)
         self.session.headers.update(headers)
         self._get_cookies()
 
@@ -112,7 +113,7 @@ class ZipRecruiter(Scraper):
                 log.error(f"Indeed: {str(e)}")
             return jobs_list, ""
 
-        res_data = res.json()
+        res_data = orjson.loads(res.text)
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
         with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
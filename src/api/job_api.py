@@ -7,20 +7,25 @@
 # pylint: disable=unused-argument
 
 """Job API endpoints."""
-from typing import List, Any
-import math
+from typing import List, Optional
+import asyncio
+import functools
+import hashlib
+import itertools
+import json
 import logging
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+import orjson
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from jobspy import scrape_jobs
+from src.core.cache import RedisCache
+from src.core.config import settings
 from src.models.job_models import DescriptionFormat, JobResponse, JobSearchParams
 
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class JobSearchResponse(BaseModel):
@@ -30,12 +35,134 @@ class JobSearchResponse(BaseModel):
 
 router = APIRouter()
 
+# Cap on concurrently running scrapes so a single large sweep cannot
+# exhaust the worker pool or hammer the job boards.
+MAX_CONCURRENT_SCRAPES = 8
+_scrape_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+
+# scrape_jobs mixes network I/O with CPU-bound HTML parsing, so the calls
+# run in worker processes rather than threads to sidestep the GIL.
+_scrape_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_scrape_pool() -> ProcessPoolExecutor:
+    """Create the scrape process pool on first use."""
+    global _scrape_pool  # pylint: disable=global-statement
+    if _scrape_pool is None:
+        _scrape_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _scrape_pool
+
+
+def shutdown_scrape_pool():
+    """Shut down the scrape process pool; called on application shutdown."""
+    global _scrape_pool  # pylint: disable=global-statement
+    if _scrape_pool is not None:
+        _scrape_pool.shutdown(wait=False, cancel_futures=True)
+        _scrape_pool = None
+
+
+def _csv(value, empty_as_none: bool = True) -> list:
+    """Split a comma-separated query param into stripped tokens.
+
+    Absent input yields [None] so itertools.product still produces the
+    single unfiltered combination; pass empty_as_none=False to get []
+    instead (site_name treats the empty list as "all sites").
+    """
+    if not value:
+        return [None] if empty_as_none else []
+    return [token for token in map(str.strip, value.split(",")) if token]
+
+
+def _cache_key(params_dict: dict) -> str:
+    """Build a stable cache key from normalized scrape parameters."""
+    canonical = json.dumps(params_dict, sort_keys=True, default=str)
+    return "jobs:" + hashlib.sha256(canonical.encode()).hexdigest()
+
+
+async def _scrape_combination(params: JobSearchParams):
+    """Run one blocking scrape_jobs call in the scrape process pool.
+
+    Results are cached in Redis so that repeated identical queries skip
+    the remote job boards entirely until the cache entry expires.
+    """
+    params_dict = params.model_dump(exclude_none=True)
+    key = _cache_key(params_dict)
+
+    cached = await RedisCache.get(key)
+    if cached is not None:
+        logger.info("Returning cached scrape results for %s", key)
+        return pickle.loads(cached)
+
+    async with _scrape_semaphore:
+        loop = asyncio.get_running_loop()
+        jobs = await loop.run_in_executor(
+            _get_scrape_pool(), functools.partial(scrape_jobs, **params_dict)
+        )
+
+    await RedisCache.set(key, pickle.dumps(jobs), settings.CACHE_EXPIRE_SECONDS)
+    return jobs
 
-def handle_nan(value: Any) -> Any:
-    """Convert NaN values to None."""
-    if isinstance(value, float) and math.isnan(value):
-        return None
-    return value
+
+# Columns consumed from the scrape_jobs DataFrame when building responses.
+_RESPONSE_COLUMNS = [
+    "site", "title", "company", "location", "city", "state", "date_posted",
+    "job_type", "min_amount", "max_amount", "currency", "is_remote",
+    "description", "experience_range",
+]
+
+
+def _jobs_to_records(jobs) -> List[dict]:
+    """Convert a scrape_jobs DataFrame to response-shaped dicts."""
+    if jobs.empty:
+        return []
+
+    # Missing columns become all-NaN instead of needing per-row .get calls.
+    jobs = jobs.reindex(columns=_RESPONSE_COLUMNS)
+
+    # Fall back to "city, state" wherever the location column is empty.
+    city = jobs["city"].fillna("").astype(str)
+    state = jobs["state"].fillna("").astype(str)
+    fallback = (city + ", " + state).str.strip(", ")
+    missing_location = jobs["location"].isna() | (jobs["location"] == "")
+    jobs.loc[missing_location, "location"] = fallback[missing_location]
+
+    # One C-level pass turns every NaN into None, so the loop below needs
+    # no per-value NaN checks.
+    jobs = jobs.astype(object).where(jobs.notna(), None)
+
+    records = []
+    for row in jobs.to_dict(orient="records"):
+        records.append({
+            "source_website": row["site"] or "",
+            "job_title": row["title"] or "",
+            "company": row["company"] or "Unknown Company",
+            "location": row["location"] or "",
+            "date_posted": str(row["date_posted"] or ""),
+            "job_type": row["job_type"],
+            "salary": row["min_amount"] or row["max_amount"],
+            "currency": row["currency"] or "USD",
+            "is_remote": row["is_remote"],
+            "job_description": row["description"],
+            "experience_range": row["experience_range"],
+        })
+    return records
+
+
+async def _stream_results(tasks):
+    """Yield NDJSON rows as each combination's scrape completes."""
+    futures = [asyncio.ensure_future(task) for task in tasks]
+    try:
+        for future in asyncio.as_completed(futures):
+            jobs = await future
+            for record in _jobs_to_records(jobs):
+                yield orjson.dumps(record) + b"\n"
+    except Exception:
+        # The status line is already sent, so the best we can do is stop
+        # the stream and cancel whatever is still in flight.
+        for future in futures:
+            future.cancel()
+        logger.exception("Error while streaming job results")
+        raise
 
 
 @router.get("/jobs", response_model=JobSearchResponse)
@@ -120,6 +247,10 @@ async def get_jobs(
         default=None,
         description="Path to CA Certificate file. Example: /path/to/cert.pem",
     ),
+    stream: bool = Query(
+        default=False,
+        description="Stream results as NDJSON instead of one JSON body. Example: true",
+    ),
 ) -> JobSearchResponse:
     """
     Search for jobs across multiple job sites.
@@ -136,6 +267,13 @@ async def get_jobs(
     Raises:
         HTTPException: If there's an error in the search parameters or job scraping.
     """
+    # Split comma-separated inputs into lists and compute the sweep once
+    search_terms = _csv(search_term)
+    locations = _csv(location)
+    job_types = _csv(job_type)
+    sites = _csv(site_name, empty_as_none=False)
+    combinations = list(itertools.product(search_terms, locations, job_types))
+
     try:
         logger.info("Job search with parameters: site_name=%s, search_term=%s, location=%s",
                     site_name, search_term, location)
@@ -144,79 +282,77 @@ async def get_jobs(
         if linkedin_company_ids:
             linkedin_company_ids = [int(id.strip()) for id in linkedin_company_ids.split(",")]
 
-        # Split comma-separated inputs into lists
-        search_terms = [term.strip() for term in search_term.split(",")] if search_term else [None]
-        locations = [loc.strip() for loc in location.split(",")] if location else [None]
-        job_types = [jt.strip() for jt in job_type.split(",")] if job_type else [None]
-        sites = [site.strip() for site in site_name.split(",")] if site_name else []
-
         all_results = []
         total_jobs = 0
 
-        # Iterate through all combinations of search parameters
-        for term in search_terms:
-            for loc in locations:
-                for jt in job_types:
-                    logger.info("Searching jobs with: term=%s, location=%s, type=%s",
-                                term, loc, jt)
-
-                    # Validate parameters
-                    params = JobSearchParams(
-                        site_name=sites,
-                        search_term=term,
-                        google_search_term=google_search_term,
-                        location=loc,
-                        distance=distance,
-                        job_type=jt,
-                        proxies=proxies,
-                        is_remote=is_remote,
-                        results_wanted=results_wanted,
-                        easy_apply=easy_apply,
-                        description_format=description_format,
-                        offset=offset,
-                        hours_old=hours_old,
-                        verbose=verbose,
-                        linkedin_fetch_description=linkedin_fetch_description,
-                        linkedin_company_ids=linkedin_company_ids,
-                        country_indeed=country_indeed,
-                        enforce_annual_salary=enforce_annual_salary,
-                        ca_cert=ca_cert,
-                    )
-
-                    # Perform job search
-                    jobs = scrape_jobs(**params.model_dump(exclude_none=True))
-                    total_jobs += len(jobs)
-                    logger.info("Found %d jobs from current search", len(jobs))
-
-
-                    # Convert to response model
-                    for _, job in jobs.iterrows():
-                        # Handle location properly
-                        job_location = handle_nan(job.get("location", ""))
-                        if not job_location:
-                            city = handle_nan(job.get("city", ""))
-                            state = handle_nan(job.get("state", ""))
-                            job_location = ", ".join(filter(None, [city, state]))
-
-                        result = JobResponse(
-                            source_website=handle_nan(job.get("site", "")),
-                            job_title=handle_nan(job.get("title", "")),
-                            company=handle_nan(job.get("company")) or "Unknown Company",
-                            location=job_location,
-                            date_posted=str(handle_nan(job.get("date_posted", ""))),
-                            job_type=handle_nan(job.get("job_type")),
-                            salary=handle_nan(job.get("min_amount") or job.get("max_amount")),
-                            currency=handle_nan(job.get("currency", "USD")),
-                            is_remote=handle_nan(job.get("is_remote", False)),
-                            job_description=handle_nan(job.get("description", "")),
-                            experience_range=handle_nan(job.get("experience_range")),
-                        )
-                        all_results.append(result)
+        # The shared fields are identical for every combination; build them
+        # once and only overlay the three varying values per iteration.
+        base_params = {
+            "site_name": sites,
+            "google_search_term": google_search_term,
+            "distance": distance,
+            "proxies": proxies,
+            "is_remote": is_remote,
+            "results_wanted": results_wanted,
+            "easy_apply": easy_apply,
+            "description_format": description_format,
+            "offset": offset,
+            "hours_old": hours_old,
+            "verbose": verbose,
+            "linkedin_fetch_description": linkedin_fetch_description,
+            "linkedin_company_ids": linkedin_company_ids,
+            "country_indeed": country_indeed,
+            "enforce_annual_salary": enforce_annual_salary,
+            "ca_cert": ca_cert,
+        }
+
+        # Validate every combination up front: creating coroutines first
+        # and failing validation mid-loop would abandon the already-created
+        # ones un-awaited.
+        validated = []
+        for term, loc, jt in combinations:
+            logger.info("Searching jobs with: term=%s, location=%s, type=%s",
+                        term, loc, jt)
+            validated.append(JobSearchParams.model_validate(
+                {**base_params, "search_term": term, "location": loc, "job_type": jt}
+            ))
+
+        # Fan the (term, location, type) sweep out concurrently; each scrape
+        # is I/O-bound, so wall time collapses to the slowest combination.
+        tasks = [_scrape_combination(params) for params in validated]
+
+        # With stream=true, rows are emitted as NDJSON the moment each
+        # combination finishes instead of buffering every response in
+        # memory for a single JSON encode at the end.
+        if stream:
+            return StreamingResponse(
+                _stream_results(tasks), media_type="application/x-ndjson"
+            )
+
+        # Convert each DataFrame as soon as its scrape finishes, so the
+        # response-building work overlaps with still-running scrapes
+        # instead of waiting for the whole sweep to complete.
+        futures = [asyncio.ensure_future(task) for task in tasks]
+        try:
+            for future in asyncio.as_completed(futures):
+                jobs = await future
+                total_jobs += len(jobs)
+                logger.info("Found %d jobs from current search", len(jobs))
+
+                # Convert to response-shaped records
+                all_results.extend(_jobs_to_records(jobs))
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
 
         logger.info("Total jobs found: %d", total_jobs)
-        return JobSearchResponse(
-            total_results=total_jobs,
-            jobs=all_results
+        # Returning the ORJSONResponse directly hands the records straight
+        # to orjson's C encoder, skipping FastAPI's per-row response_model
+        # re-validation pass; the JobSearchResponse model still documents
+        # the schema in OpenAPI.
+        return ORJSONResponse(
+            content={"total_results": total_jobs, "jobs": all_results}
         )
 
     except ValueError as e:
@@ -1,5 +1,6 @@
 """API endpoints for log management."""
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, Query
 
 from src.core.mongodb import MongoDB
@@ -9,19 +10,31 @@ router = APIRouter()
 @router.get("/logs", response_model=List[Dict[str, Any]])
 async def get_logs(
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
-    limit: int = Query(100, ge=1, le=1000, description="Number of records to return")
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    before: Optional[datetime] = Query(
+        None,
+        description="Only return logs older than this timestamp (cursor pagination)",
+    ),
+    path: Optional[str] = Query(
+        None,
+        description="Only return logs for this request path. Example: /api/v1/jobs",
+    )
 ):
     """
-    Retrieve API request logs.
+    Retrieve API request logs, newest first.
 
     Args:
         skip: Number of records to skip (for pagination)
         limit: Maximum number of records to return
+        before: Oldest timestamp of the previous page; paginating with this
+            cursor uses an indexed range query instead of skip
+        path: Exact request path to filter on; served by the compound
+            (path, timestamp) index
 
     Returns:
         List of log entries
     """
-    logs = await MongoDB.get_logs(skip=skip, limit=limit)
+    logs = await MongoDB.get_logs(skip=skip, limit=limit, before=before, path=path)
     # Convert ObjectId to string in the response
     for log in logs:
         if '_id' in log:
@@ -0,0 +1,58 @@
+# pylint: disable=too-few-public-methods
+# pylint: disable=broad-exception-caught
+
+"""Redis cache for scraped job results."""
+import logging
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCache:
+    """Redis client used to cache scrape results for repeated queries."""
+
+    client: Optional[Redis] = None
+
+    @classmethod
+    async def connect_to_redis(cls):
+        """Connect to Redis. The cache is optional, so failures only warn."""
+        try:
+            cls.client = Redis.from_url(settings.REDIS_URL)
+            await cls.client.ping()
+            logger.info("Connected to Redis")
+        except Exception as e:
+            cls.client = None
+            logger.warning("Redis unavailable, scrape caching disabled: %s", e)
+
+    @classmethod
+    async def close_redis_connection(cls):
+        """Close Redis connection."""
+        if cls.client is not None:
+            await cls.client.aclose()
+            cls.client = None
+            logger.info("Redis connection closed")
+
+    @classmethod
+    async def get(cls, key: str) -> Optional[bytes]:
+        """Fetch a cached value, or None on miss or cache failure."""
+        if cls.client is None:
+            return None
+        try:
+            return await cls.client.get(key)
+        except Exception as e:
+            logger.warning("Redis GET failed for %s: %s", key, e)
+            return None
+
+    @classmethod
+    async def set(cls, key: str, value: bytes, expire_seconds: int):
+        """Store a value with a TTL; cache failures are non-fatal."""
+        if cls.client is None:
+            return
+        try:
+            await cls.client.set(key, value, ex=expire_seconds)
+        except Exception as e:
+            logger.warning("Redis SET failed for %s: %s", key, e)
@@ -1,23 +1,31 @@
 # pylint: disable=too-few-public-methods
 
 '''importing required modules.'''
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
-load_dotenv()
-
 class Settings(BaseSettings):
     '''Settings class to save settings'''
     CORS_ORIGINS: list[str] = ["*"]
     RATE_LIMIT_PER_MINUTE: int = 10
     CACHE_EXPIRE_SECONDS: int = 300
+    REDIS_URL: str = "redis://localhost:6379/0"
     MONGODB_URL : str
     DB_NAME : str
     COLLECTION_NAME : str
+    LOG_TTL_SECONDS : int = 604800 # Request logs expire after 7 days
 
     class Config:
         '''Config class to save .env'''
         env_file = ".env"
         case_sensitive = False
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    '''Read .env and build the Settings object exactly once per process'''
+    load_dotenv()
+    return Settings()
+
+settings = get_settings()
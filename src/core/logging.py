@@ -1,25 +1,41 @@
 ''' importing modules'''
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 def setup_logging():
     '''Function to configure and initialize logging for the application'''
-    # Set up basic configuration for logging
-    logging.basicConfig(
-        level=logging.INFO, # Set the logging level to INFO (can change it to DEBUG, WARNING, etc.)
-        # Define the format of log messages
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        # Define the handlers that determine where logs are output
-        handlers=[
-            # Write logs to a file 'jobscraper.log'
-            # Rotate the log file after it reaches ~10MB
-            # Keep up to 5 backup log files
-            RotatingFileHandler(
-                'jobscraper.log',
-                maxBytes=10000000, # ~10 MB
-                backupCount=5 # Keep last 5 log files
-            ),
-            # Also output log messages to the console (stdout)
-            logging.StreamHandler()
-        ]
+    # Define the format of log messages
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    # Write logs to a file 'jobscraper.log'
+    # Rotate the log file after it reaches ~10MB
+    # Keep up to 5 backup log files
+    file_handler = RotatingFileHandler(
+        'jobscraper.log',
+        maxBytes=10000000, # ~10 MB
+        backupCount=5 # Keep last 5 log files
+    )
+    file_handler.setFormatter(formatter)
+
+    # Also output log messages to the console (stdout)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
+    # Emitting threads only enqueue records; the listener thread does the
+    # blocking file/console I/O (and file rotation) off the event loop.
+    log_queue = queue.Queue(-1)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO) # Set the logging level to INFO
+    root_logger.handlers = [QueueHandler(log_queue)]
+
+    listener = QueueListener(
+        log_queue,
+        file_handler,
+        console_handler,
+        respect_handler_level=True,
     )
+    listener.start()
+    # Flush any queued records when the process exits
+    atexit.register(listener.stop)
@@ -1,9 +1,10 @@
 # pylint: disable=too-few-public-methods
 
 """Middleware for request timeout handling."""
-import time
+import asyncio
 from typing import Callable
-from fastapi import Request, Response, HTTPException
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.status import HTTP_504_GATEWAY_TIMEOUT
 
@@ -15,15 +16,17 @@ class TimeoutMiddleware(BaseHTTPMiddleware):
         self.timeout_seconds = timeout_seconds
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-
+        # wait_for cancels the downstream handler at the deadline, so even
+        # a hung scrape cannot hold the request open indefinitely.
         try:
-            response = await call_next(request)
-            return response
-        except Exception as e:
-            if time.time() - start_time > self.timeout_seconds:
-                raise HTTPException(
-                    status_code=HTTP_504_GATEWAY_TIMEOUT,
-                    detail="Request timed out"
-                ) from e
-            raise
+            return await asyncio.wait_for(
+                call_next(request), timeout=self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            # Raising here would bypass FastAPI's exception handlers (they
+            # live below this middleware in the stack) and surface as a
+            # 500, so build the 504 response directly.
+            return JSONResponse(
+                {"detail": "Request timed out"},
+                status_code=HTTP_504_GATEWAY_TIMEOUT,
+            )
@@ -8,30 +8,104 @@
 # pylint: disable=too-few-public-methods
 
 """MongoDB database connection and operations."""
+import asyncio
 import logging
 import uuid
-from typing import Optional
+from typing import List, Optional
+
+import orjson
+import zstandard
 from pymongo import AsyncMongoClient
+from pymongo.errors import OperationFailure
+from pymongo.write_concern import WriteConcern
 
 from src.core.config import settings
 from src.models.log_models import RequestLog
 
 logger = logging.getLogger(__name__)
 
+# Header names stripped from stored request logs.
+_REDACTED_HEADERS = frozenset({"authorization", "cookie", "proxy-authorization"})
+
+# Browser header blocks are ~1-2KB of highly repetitive text; zstd at level
+# 3 typically shrinks them 4-6x before they hit Mongo. Compressor and
+# decompressor are built once and reused.
+_zstd_compressor = zstandard.ZstdCompressor(level=3)
+_zstd_decompressor = zstandard.ZstdDecompressor()
+
 class MongoDB:
     """MongoDB client for database operations."""
 
     client: Optional[AsyncMongoClient] = None
     db: Optional[AsyncMongoClient] = None
     collection: Optional[AsyncMongoClient] = None
+    # Same collection with w=0: access logs are loss-tolerant, so the
+    # background writers skip waiting for the primary's acknowledgment.
+    log_collection: Optional[AsyncMongoClient] = None
+
+    # Request logs are enqueued here and written by background workers so
+    # the middleware never waits on a Mongo round-trip.
+    log_queue: Optional[asyncio.Queue] = None
+    _log_writers: List[asyncio.Task] = []
+
+    LOG_WRITER_COUNT = 4
+    LOG_BATCH_SIZE = 100
+    LOG_FLUSH_SECONDS = 1.0
+    LOG_QUEUE_MAXSIZE = 10000
 
     @classmethod
     async def connect_to_mongodb(cls):
         """Connect to MongoDB."""
         try:
-            cls.client = AsyncMongoClient(settings.MONGODB_URL)
+            # Size the pool explicitly: keep a warm floor of connections so
+            # bursts don't pay connection setup, cap the ceiling, fail server
+            # selection fast, and compress the wire protocol (zstandard is
+            # already a dependency for the stored header blobs).
+            cls.client = AsyncMongoClient(
+                settings.MONGODB_URL,
+                maxPoolSize=50,
+                minPoolSize=10,
+                maxIdleTimeMS=30000,
+                serverSelectionTimeoutMS=5000,
+                retryWrites=True,
+                compressors="zstd",
+            )
             cls.db = cls.client.get_database(settings.DB_NAME)
             cls.collection = cls.db.get_collection(settings.COLLECTION_NAME)
+            # Index the lookup and sort keys, and let MongoDB expire old
+            # logs in the background instead of growing unbounded.
+            await cls.collection.create_index([("request_id", 1)], unique=True)
+            try:
+                await cls.collection.create_index(
+                    [("timestamp", 1)],
+                    expireAfterSeconds=settings.LOG_TTL_SECONDS,
+                    name="timestamp_ttl",
+                )
+            except OperationFailure as e:
+                # The index already exists with a different TTL (code 85,
+                # IndexOptionsConflict) after a LOG_TTL_SECONDS change;
+                # update it in place instead of failing startup.
+                if e.code != 85:
+                    raise
+                await cls.db.command(
+                    "collMod",
+                    settings.COLLECTION_NAME,
+                    index={
+                        "name": "timestamp_ttl",
+                        "expireAfterSeconds": settings.LOG_TTL_SECONDS,
+                    },
+                )
+            # Serves path-filtered, newest-first log queries without a
+            # collection scan.
+            await cls.collection.create_index([("path", 1), ("timestamp", -1)])
+            cls.log_collection = cls.db.get_collection(
+                settings.COLLECTION_NAME, write_concern=WriteConcern(w=0)
+            )
+            cls.log_queue = asyncio.Queue(maxsize=cls.LOG_QUEUE_MAXSIZE)
+            cls._log_writers = [
+                asyncio.create_task(cls._log_writer())
+                for _ in range(cls.LOG_WRITER_COUNT)
+            ]
             logger.info("Connected to MongoDB")
         except Exception as e:
             logger.error("Could not connect to MongoDB: %s", e)
@@ -40,36 +114,107 @@ class MongoDB:
     @classmethod
     async def close_mongodb_connection(cls):
         """Close MongoDB connection."""
+        for writer in cls._log_writers:
+            writer.cancel()
+        cls._log_writers = []
+        await cls._flush_log_queue()
         if cls.client is not None:
             cls.client.close()
             logger.info("MongoDB connection closed")
 
     @classmethod
-    async def log_request(cls, request_data: RequestLog):
-        """Log request data to MongoDB."""
-        if cls.collection is None:
+    async def _log_writer(cls):
+        """Drain the log queue and write request logs in batches."""
+        # Bind the hot attributes once; the loop runs for the process
+        # lifetime and should not re-resolve them per document.
+        queue_get = cls.log_queue.get
+        insert_many = cls.log_collection.insert_many
+        batch_size = cls.LOG_BATCH_SIZE
+        flush_seconds = cls.LOG_FLUSH_SECONDS
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue_get()]
+            # One deadline for the whole batch: flush when it fills or when
+            # flush_seconds have passed since its first document, whichever
+            # comes first. A per-get timeout would restart the clock on
+            # every arrival and let steady traffic defer the flush forever.
+            deadline = loop.time() + flush_seconds
+            try:
+                while len(batch) < batch_size:
+                    batch.append(
+                        await asyncio.wait_for(
+                            queue_get(), timeout=deadline - loop.time()
+                        )
+                    )
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await insert_many(batch, ordered=False)
+                logger.info("Wrote %d request logs to MongoDB", len(batch))
+            except Exception as e:
+                logger.error("Failed to write request logs to MongoDB: %s", e)
+
+    @classmethod
+    async def _flush_log_queue(cls):
+        """Write any logs still queued when the application shuts down."""
+        if cls.log_queue is None or cls.log_collection is None:
+            return
+        batch = []
+        while not cls.log_queue.empty():
+            batch.append(cls.log_queue.get_nowait())
+        if batch:
+            try:
+                await cls.log_collection.insert_many(batch, ordered=False)
+                logger.info("Flushed %d request logs on shutdown", len(batch))
+            except Exception as e:
+                logger.error("Failed to flush request logs on shutdown: %s", e)
+
+    @classmethod
+    def log_request(cls, request_data: RequestLog):
+        """Queue request data for background insertion into MongoDB."""
+        if cls.log_queue is None:
             raise RuntimeError("MongoDB connection not initialized")
         try:
-            await cls.collection.insert_one(request_data.model_dump())
-            logger.info("Successfully logged request %s", request_data.request_id)
-        except Exception as e:
-            logger.error("Failed to log request to MongoDB: %s", e)
-            raise
+            cls.log_queue.put_nowait(request_data.model_dump())
+        except asyncio.QueueFull:
+            # Shedding a log beats applying backpressure to the request
+            # path when Mongo cannot keep up.
+            logger.warning(
+                "Request log queue full, dropping log %s", request_data.request_id
+            )
 
     @classmethod
-    async def get_logs(cls, skip: int = 0, limit: int = 100):
-        """Retrieve logs from MongoDB."""
+    async def get_logs(cls, skip: int = 0, limit: int = 100, before=None, path=None):
+        """Retrieve logs from MongoDB, newest first.
+
+        Passing the oldest timestamp of the previous page as `before`
+        paginates with an indexed range query instead of an O(skip) scan;
+        `path` narrows to one request path via the (path, timestamp) index.
+        """
         if cls.collection is None:
             raise RuntimeError("MongoDB connection not initialized")
         try:
-            # First check if collection exists
-            collections = await cls.db.list_collection_names()
-            if settings.COLLECTION_NAME not in collections:
-                logger.warning("Collection %s does not exist", settings.COLLECTION_NAME)
-                return []
-
-            cursor = cls.collection.find().skip(skip).limit(limit)
+            # The collection is guaranteed to exist: index creation at
+            # startup creates it, so no per-call existence probe is needed.
+            query = {}
+            if path:
+                query["path"] = path
+            if before:
+                query["timestamp"] = {"$lt": before}
+            cursor = (
+                cls.collection.find(query)
+                .sort("timestamp", -1)
+                .skip(skip)
+                .limit(limit)
+            )
             logs = await cursor.to_list(length=limit)
+            # Expand the compressed header blob back into a dict for callers
+            for log in logs:
+                headers_z = log.pop("headers_z", None)
+                if headers_z:
+                    log["headers"] = orjson.loads(
+                        _zstd_decompressor.decompress(bytes(headers_z))
+                    )
             logger.info("Retrieved %d logs from MongoDB", len(logs))
             return logs
         except Exception as e:
@@ -81,7 +226,7 @@ class RequestLogger:
     """Request logger that logs to MongoDB."""
 
     @staticmethod
-    async def log_request(
+    def log_request(
         method: str,
         path: str,
         query_params: dict,
@@ -93,18 +238,26 @@ class RequestLogger:
     ):
         """Log request and response details to MongoDB."""
 
-        # Create request log entry
+        # Drop sensitive headers in place instead of rebuilding the dict;
+        # the common case (no sensitive headers) allocates nothing.
+        headers = dict(headers)
+        for key in list(headers):
+            if key.lower() in _REDACTED_HEADERS:
+                del headers[key]
+
+        # Create request log entry. uuid1 is time-based and avoids the
+        # per-request /dev/urandom read that uuid4 does.
         request_log = RequestLog(
-            request_id=str(uuid.uuid4()),
+            request_id=str(uuid.uuid1()),
             method=method,
             path=path,
             query_params=query_params,
-            headers={k: v for k, v in headers.items() if k.lower() != "authorization"},
+            headers_z=_zstd_compressor.compress(orjson.dumps(headers)),
             client_ip=client_ip,
             response_status=response_status,
             response_time_ms=response_time_ms,
             user_agent=user_agent
         )
 
-        # Log to MongoDB
-        await MongoDB.log_request(request_log)
+        # Enqueue for the background writers; never blocks the caller
+        MongoDB.log_request(request_log)
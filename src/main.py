@@ -1,6 +1,7 @@
 # pylint: disable=broad-exception-caught
 
 """Main FastAPI application."""
+import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
@@ -8,9 +9,11 @@ from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from src.api.job_api import router as job_router
+from src.api.job_api import router as job_router, shutdown_scrape_pool
 from src.api.log_api import router as log_router
+from src.core.cache import RedisCache
 from src.core.config import settings
 from src.core.logging import setup_logging
 from src.core.mongodb import MongoDB, RequestLogger
@@ -25,15 +28,20 @@ async def lifespan(_app: FastAPI):
     """Lifespan context manager for FastAPI application."""
     # Startup
     await MongoDB.connect_to_mongodb()
+    await RedisCache.connect_to_redis()
     yield
     # Shutdown
+    shutdown_scrape_pool()
+    await RedisCache.close_redis_connection()
     await MongoDB.close_mongodb_connection()
 
 app = FastAPI(
     title="JobScraper API",
     description="API for scraping jobs from multiple sources",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes large /jobs and /logs bodies at C speed
+    default_response_class=ORJSONResponse,
 )
 
 # Add timeout middleware
@@ -42,65 +50,109 @@ app.add_middleware(TimeoutMiddleware, timeout_seconds=60)
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Middleware to log all API requests and responses."""
-    start_time = time.time()
-
-    # Log request
-    logger.info("Request: %s %s", request.method, request.url.path)
-    logger.info("Query params: %s", dict(request.query_params))
+    # Monotonic integer clock: immune to NTP jumps and cheaper than
+    # float wall-clock arithmetic
+    start_ns = time.perf_counter_ns()
+
+    # Materialize the multidicts once; both the logger and the request
+    # log below reuse the same objects. Headers decode straight from the
+    # raw ASGI scope (keys arrive lowercased), skipping the
+    # case-insensitive Headers wrapper and its per-lookup scans
+    query_params = dict(request.query_params)
+    headers = {
+        key.decode("latin-1"): value.decode("latin-1")
+        for key, value in request.scope["headers"]
+    }
 
     # Process request
     response = await call_next(request)
 
-    # Calculate processing time
-    process_time = time.time() - start_time
-    process_time_ms = process_time * 1000  # Convert to milliseconds
-
-    # Log response
-    logger.info("Response: %s - Processed in %.2fs", response.status_code, process_time)
-
-    # Store request/response logs in MongoDB
-    await RequestLogger.log_request(
+    # Calculate processing time in milliseconds
+    process_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+    # One structured record per request; the guard makes this free when
+    # the logger runs above INFO in production
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "%s %s params=%s -> %s in %.2fms",
+            request.method,
+            request.url.path,
+            query_params,
+            response.status_code,
+            process_time_ms,
+        )
+
+    # Queue request/response logs for MongoDB; the write happens on the
+    # background batch writers, never on the response path
+    RequestLogger.log_request(
         method=request.method,
         path=request.url.path,
-        query_params=dict(request.query_params),
-        headers=dict(request.headers),
+        query_params=query_params,
+        headers=headers,
         client_ip=request.client.host if request.client else None,
         response_status=response.status_code,
         response_time_ms=process_time_ms,
-        user_agent=request.headers.get("user-agent")
+        user_agent=headers.get("user-agent")
     )
 
     return response
 
 # Configure CORS
+# Enumerating the methods/headers we actually use lets Starlette answer
+# preflights from a static response instead of echoing the request, and
+# max_age lets browsers skip the OPTIONS round-trip entirely for a day
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "OPTIONS"),
+    allow_headers=("Authorization", "Content-Type", "User-Agent"),
+    max_age=86400,
 )
 
 # Include routers
 app.include_router(job_router, prefix="/api/v1")
 app.include_router(log_router, prefix="/api/v1/logs", tags=["logs"])
 
+# Liveness probes and load balancers can hit /health every second or two;
+# cache the last successful ping briefly so probe storms don't each cost a
+# round-trip to the Mongo primary.
+_PING_TTL_NS = 2_000_000_000  # 2s
+_last_ping_ns = 0
+_last_ping_ok = False
+
 @app.get("/health", tags=["health"])
 async def health_check():
     """Check the health of the API and database connection."""
+    global _last_ping_ns, _last_ping_ok  # pylint: disable=global-statement
     try:
         # Check MongoDB connection
         if MongoDB.db is None:
             return {"status": "error", "message": "MongoDB not connected"}
 
-        # Try to ping the database
-        await MongoDB.db.command("ping")
+        # Only re-ping once the cached result has expired or after a
+        # failure, and never let the ping hang the probe: during a Mongo
+        # failover the endpoint fast-fails as degraded instead
+        now = time.perf_counter_ns()
+        if not _last_ping_ok or now - _last_ping_ns >= _PING_TTL_NS:
+            try:
+                await asyncio.wait_for(MongoDB.db.command("ping"), timeout=0.5)
+            except asyncio.TimeoutError:
+                _last_ping_ok = False
+                return {
+                    "status": "degraded",
+                    "database": "unresponsive",
+                    "message": "MongoDB ping timed out"
+                }
+            _last_ping_ns = now
+            _last_ping_ok = True
         return {
             "status": "healthy",
             "database": "connected",
             "message": "API and database are working correctly"
         }
     except Exception as e:
+        _last_ping_ok = False
         logger.exception("Database connection error")
         return {
             "status": "error",
@@ -108,4 +160,4 @@ async def health_check():
         }
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run("src.main:app", host="0.0.0.0", port=8000, reload=True)
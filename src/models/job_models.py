@@ -7,9 +7,10 @@
 # pylint: disable=unused-argument
 
 """Job models for the API."""
+import re
 from enum import Enum
 from typing import List, Optional, Union
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class JobType(str, Enum):
@@ -28,9 +29,40 @@ class DescriptionFormat(str, Enum):
     HTML = "html"
 
 
+# The allowed values are fixed at import time; rebuilding these sets (and
+# enumerating JobType) inside the validators was per-request overhead.
+_VALID_SITES = frozenset(
+    {"linkedin", "indeed", "zip_recruiter", "glassdoor", "google", "bayt"}
+)
+_VALID_JOB_TYPES = frozenset(t.value for t in JobType)
+
+# Fuses the split and strip of comma-separated input into one C-level call
+_CSV_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
+def _csv_pattern(values: frozenset) -> re.Pattern:
+    """Compile an anchored pattern accepting a comma-separated list of values."""
+    alternation = "|".join(sorted(values))
+    return re.compile(
+        rf"\s*(?:{alternation})\s*(?:,\s*(?:{alternation})\s*)*",
+        re.IGNORECASE,
+    )
+
+
+# Accepting the common string input is a single C-level regex scan; the
+# set-difference path below only runs for rejected or list-typed input.
+_SITES_RE = _csv_pattern(_VALID_SITES)
+_JOB_TYPES_RE = _csv_pattern(_VALID_JOB_TYPES)
+
+
 class JobResponse(BaseModel):
     """Response model for job data."""
 
+    # Instances are bulk-built from scraper rows and never mutated:
+    # drop unknown scraper columns instead of erroring and freeze the
+    # model so no per-instance mutation machinery is kept around.
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     source_website: str = Field(..., description="Website where the job was found")
     job_title: str = Field(..., description="Title of the job")
     company: Optional[str] = Field(None, description="Company name")
@@ -132,16 +164,18 @@ class JobSearchParams(BaseModel):
         """Validate site names."""
         if v is None:
             return None
-        valid_sites = {"linkedin", "indeed", "zip_recruiter", "glassdoor", "google", "bayt"}
         if isinstance(v, str):
-            sites = {site.strip().lower() for site in v.split(",")}
+            if _SITES_RE.fullmatch(v):
+                return list(set(_CSV_SPLIT_RE.split(v.strip().lower())))
+            sites = set(_CSV_SPLIT_RE.split(v.strip().lower()))
         else:
             sites = {site.strip().lower() for site in v}
-        invalid_sites = sites - valid_sites
+        sites.discard("")
+        invalid_sites = sites - _VALID_SITES
         if invalid_sites:
             raise ValueError(
                 f"Invalid site names: {', '.join(invalid_sites)}. "
-                f"Valid sites are: {', '.join(valid_sites)}"
+                f"Valid sites are: {', '.join(_VALID_SITES)}"
             )
         return list(sites)
 
@@ -151,13 +185,15 @@ class JobSearchParams(BaseModel):
         """Validate job types."""
         if v is None:
             return v
-        valid_types = {t.value for t in JobType}
-        types = {t.strip().lower() for t in v.split(",")}
-        invalid_types = types - valid_types
+        if _JOB_TYPES_RE.fullmatch(v):
+            return v
+        types = set(_CSV_SPLIT_RE.split(v.strip().lower()))
+        types.discard("")
+        invalid_types = types - _VALID_JOB_TYPES
         if invalid_types:
             raise ValueError(
                 f"Invalid job types: {', '.join(invalid_types)}. "
-                f"Valid types are: {', '.join(valid_types)}"
+                f"Valid types are: {', '.join(_VALID_JOB_TYPES)}"
             )
         return v
 
@@ -1,16 +1,24 @@
 """Models for request logging."""
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class RequestLog(BaseModel):
     """Model for API request logs stored in MongoDB."""
+    # Logs are built once, dumped and discarded - never mutated
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     request_id: str = Field(..., description="Unique request identifier")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Time of request")
+    timestamp: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Time of request",
+    )
     method: str = Field(..., description="HTTP method")
     path: str = Field(..., description="Request path")
     query_params: Dict[str, Any] = Field(default_factory=dict, description="Query parameters")
-    headers: Dict[str, str] = Field(default_factory=dict, description="Request headers")
+    headers_z: Optional[bytes] = Field(
+        None, description="Request headers, orjson-encoded and zstd-compressed"
+    )
     client_ip: Optional[str] = Field(None, description="Client IP address")
     response_status: int = Field(..., description="Response status code")
     response_time_ms: float = Field(..., description="Response time in milliseconds")